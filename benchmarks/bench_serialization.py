@@ -0,0 +1,68 @@
+"""
+Benchmark for contact serialization: encode time and bytes on the wire.
+
+Usage:
+    python benchmarks/bench_serialization.py [number_of_contacts]
+"""
+import gzip
+import json
+import sys
+import timeit
+import zlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import COMPRESSION_LEVEL
+from contacts import Contact
+from serialization import contacts_to_json
+
+def make_contacts(count: int) -> list:
+    """Generate synthetic contacts for benchmarking."""
+    return [
+        Contact(
+            name=f"Contact Person {i}",
+            phone=f"+49 (0) 1590 {i:07d}",
+            email=f"contact.person{i}@example.com",
+            address=f"Musterstraße {i % 200}, {10000 + i % 90000} Berlin"
+        )
+        for i in range(count)
+    ]
+
+def time_it(func, repeat: int = 5) -> float:
+    """Return the best wall time in milliseconds over several runs."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    contacts = make_contacts(count)
+    print(f"Serializing {count} contacts\n")
+
+    encoders = {
+        "dicts + json.dumps (jsonify)": lambda: json.dumps([c.to_dict() for c in contacts]),
+        "contacts_to_json (fast path)": lambda: contacts_to_json(contacts),
+        "storage indent=2": lambda: json.dumps(
+            [c.to_dict() for c in contacts], indent=2, ensure_ascii=False
+        ),
+        "storage compact": lambda: contacts_to_json(contacts, ensure_ascii=False),
+    }
+
+    print(f"{'encoder':<32}{'encode ms':>12}{'bytes':>12}")
+    for label, encode in encoders.items():
+        size = len(encode().encode("utf-8"))
+        print(f"{label:<32}{time_it(encode):>12.2f}{size:>12,}")
+
+    payload = contacts_to_json(contacts).encode("utf-8")
+    compressors = {
+        "identity": lambda: payload,
+        "gzip": lambda: gzip.compress(payload, compresslevel=COMPRESSION_LEVEL),
+        "deflate": lambda: zlib.compress(payload, COMPRESSION_LEVEL),
+    }
+
+    print(f"\n{'content-encoding':<32}{'compress ms':>12}{'bytes':>12}")
+    for label, compress in compressors.items():
+        size = len(compress())
+        print(f"{label:<32}{time_it(compress):>12.2f}{size:>12,}")
+
+if __name__ == "__main__":
+    main()
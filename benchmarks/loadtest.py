@@ -0,0 +1,305 @@
+"""
+Load test for the Contact Book web API.
+
+Starts the Flask app from main on a local port with a synthetic contact
+book, replays a weighted mix of API operations over many concurrent
+connections and reports throughput and latency percentiles per route.
+Routes exceeding their latency SLOs are flagged and make the script exit
+with status 1; if the server fails to start the exit status is 2.
+
+The server runs in its own process so that it does not compete with the
+client for the GIL. Mutations are persisted to a temporary file;
+contacts.json is not touched. The app answers 500 when a save fails, so
+persistence errors show up in the error column.
+
+Usage:
+    python benchmarks/loadtest.py --contacts 10000 --concurrency 50 --duration 20 \\
+        --mix search=60,create=15,update=15,delete=10 --slo search:p95=50
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import random
+import re
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from werkzeug.serving import make_server
+
+import main
+import storage
+from contacts import ContactBook
+from bench_serialization import make_contacts
+
+HOST = "127.0.0.1"
+
+DEFAULT_MIX = {"search": 50, "suggest": 20, "create": 10, "update": 15, "delete": 5}
+
+# Latency objectives in milliseconds per route and percentile
+DEFAULT_SLOS = {
+    "search": {"p95": 100, "p99": 250},
+    "suggest": {"p95": 20, "p99": 50},
+    "create": {"p95": 200, "p99": 500},
+    "update": {"p95": 200, "p99": 500},
+    "delete": {"p95": 200, "p99": 500},
+}
+
+PERCENTILES = (50, 95, 99)
+
+# Seconds to wait for the server process to build its contact book and listen
+STARTUP_TIMEOUT = 120.0
+
+def parse_mix(text: str) -> Dict[str, int]:
+    """Parse a mix such as "search=60,create=40" into route weights."""
+    mix = {}
+    for part in text.split(","):
+        route, _, weight = part.partition("=")
+        route = route.strip()
+        if route not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown route in mix: {route}")
+        mix[route] = int(weight)
+    return mix
+
+def parse_slo(text: str) -> Tuple[str, str, float]:
+    """Parse an SLO such as "search:p95=50" into (route, percentile, ms)."""
+    match = re.fullmatch(r"(\w+):(p\d+(?:\.\d+)?)=(\d+(?:\.\d+)?)", text.strip())
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid SLO, expected ROUTE:pNN=MS: {text}")
+    return match.group(1), match.group(2), float(match.group(3))
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+async def http_request(
+    port: int,
+    method: str,
+    path: str,
+    body: Optional[Dict] = None
+) -> Tuple[int, bytes]:
+    """
+    Send one HTTP/1.1 request on a fresh connection and read the full response.
+
+    Returns:
+        Tuple[int, bytes]: Status code and response body
+    """
+    payload = json.dumps(body).encode("utf-8") if body is not None else b""
+    head = (
+        f"{method} {path} HTTP/1.1\r\n"
+        f"Host: {HOST}:{port}\r\n"
+        "Connection: close\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n"
+    )
+
+    reader, writer = await asyncio.open_connection(HOST, port)
+    try:
+        writer.write(head.encode("ascii") + payload)
+        await writer.drain()
+        data = await reader.read()
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+    status_line, _, rest = data.partition(b"\r\n")
+    _, _, response_body = rest.partition(b"\r\n\r\n")
+    return int(status_line.split()[1]), response_body
+
+def random_fields() -> Dict[str, str]:
+    """Generate random form data for create and update requests."""
+    suffix = "".join(random.choices(string.ascii_lowercase, k=6))
+    return {
+        "name": f"Load Test {suffix}",
+        "phone": f"+49 {random.randint(1000000, 9999999)}",
+        "email": f"load.{suffix}@example.com",
+        "address": f"Teststraße {random.randint(1, 200)}",
+    }
+
+class LoadTest:
+    """Replays a weighted operation mix against a running server."""
+
+    def __init__(self, port: int, contact_ids: List[str], mix: Dict[str, int]):
+        self.port = port
+        self.contact_ids = contact_ids
+        self.routes = [route for route, weight in mix.items() if weight > 0]
+        self.weights = [mix[route] for route in self.routes]
+        self.latencies: Dict[str, List[float]] = {route: [] for route in self.routes}
+        self.errors: Dict[str, int] = {route: 0 for route in self.routes}
+
+    async def _run_operation(self, route: str) -> Optional[bool]:
+        """
+        Run a single operation.
+
+        Returns:
+            Optional[bool]: Whether the response was successful, or None if no
+            request was sent because there was no contact left to update or delete
+        """
+        if route == "search":
+            query = random.choice(["load", "person", "example", str(random.randint(0, 999))])
+            status, _ = await http_request(self.port, "GET", f"/api/contacts?q={quote(query)}")
+        elif route == "suggest":
+            prefix = random.choice(["con", "contact p", "lo", "load"])
+            status, _ = await http_request(
+                self.port, "GET", f"/api/contacts/suggest?prefix={quote(prefix)}&k=10"
+            )
+        elif route == "create":
+            status, body = await http_request(self.port, "POST", "/api/contacts", random_fields())
+            if status == 200:
+                self.contact_ids.append(json.loads(body)["contact"]["contact_id"])
+        elif not self.contact_ids:
+            return None
+        elif route == "update":
+            contact_id = random.choice(self.contact_ids)
+            status, _ = await http_request(
+                self.port, "PUT", f"/api/contacts/{contact_id}", random_fields()
+            )
+        else:
+            contact_id = self.contact_ids.pop(random.randrange(len(self.contact_ids)))
+            status, _ = await http_request(self.port, "DELETE", f"/api/contacts/{contact_id}")
+        return status == 200
+
+    async def _worker(self, deadline: float):
+        """Issue operations back to back until the deadline."""
+        while time.perf_counter() < deadline:
+            route = random.choices(self.routes, self.weights)[0]
+            start = time.perf_counter()
+            try:
+                ok = await self._run_operation(route)
+            except (OSError, ValueError, KeyError, IndexError) as e:
+                logging.getLogger(__name__).debug(f"{route} request failed: {e}")
+                ok = False
+            if ok is None:
+                continue
+            self.latencies[route].append((time.perf_counter() - start) * 1000)
+            if not ok:
+                self.errors[route] += 1
+
+    async def run(self, concurrency: int, duration: float) -> float:
+        """
+        Run the workers concurrently.
+
+        Returns:
+            float: Elapsed wall time in seconds
+        """
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(*(self._worker(deadline) for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+    def report(self, elapsed: float, slos: Dict[str, Dict[str, float]]) -> bool:
+        """
+        Print per-route throughput and latency, flagging SLO breaches.
+
+        Returns:
+            bool: True if every route met its SLOs
+        """
+        header = f"{'route':<10}{'requests':>10}{'errors':>8}{'req/s':>10}"
+        header += "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES)
+        print(header)
+
+        breaches = []
+        total = 0
+        for route in self.routes:
+            values = sorted(self.latencies[route])
+            total += len(values)
+            results = {f"p{p}": percentile(values, p) for p in PERCENTILES}
+            line = f"{route:<10}{len(values):>10}{self.errors[route]:>8}{len(values) / elapsed:>10.1f}"
+            line += "".join(f"{results[f'p{p}']:>10.2f}" for p in PERCENTILES)
+            print(line)
+
+            for name, limit in slos.get(route, {}).items():
+                observed = percentile(values, float(name[1:]))
+                if values and observed > limit:
+                    breaches.append(f"{route} {name} {observed:.2f} ms > {limit:.2f} ms")
+
+        print(f"\n{total} requests in {elapsed:.1f} s ({total / elapsed:.1f} req/s)")
+        if breaches:
+            print("\nSLO BREACHES:")
+            for breach in breaches:
+                print(f"  {breach}")
+            return False
+        print("All routes within SLO")
+        return True
+
+def serve(contact_count: int, storage_file: str, conn) -> None:
+    """
+    Serve main.app with a synthetic contact book on a free local port.
+
+    Runs in a child process. Sends (port, contact_ids) back through conn once
+    the server is listening, then serves until terminated.
+    """
+    # Keep per-request logging out of the measurements
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    storage.CONTACTS_FILE = storage_file
+
+    main.contact_book = ContactBook.from_dict_list([c.to_dict() for c in make_contacts(contact_count)])
+    server = make_server(HOST, 0, main.app, threaded=True)
+    conn.send((server.server_port, [c.contact_id for c in main.contact_book.contacts]))
+    conn.close()
+    server.serve_forever()
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--contacts", type=int, default=10000, help="synthetic contacts to preload")
+    parser.add_argument("--concurrency", type=int, default=50, help="concurrent connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="test duration in seconds")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="route weights, e.g. search=60,create=15,update=15,delete=10")
+    parser.add_argument("--slo", type=parse_slo, action="append", default=[],
+                        help="latency objective ROUTE:pNN=MS, may be repeated")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for the workload")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    slos = {route: dict(limits) for route, limits in DEFAULT_SLOS.items()}
+    for route, name, limit in args.slo:
+        slos.setdefault(route, {})[name] = limit
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        server = multiprocessing.Process(
+            target=serve,
+            args=(args.contacts, str(Path(tmp_dir) / "contacts.json"), child_conn),
+            daemon=True
+        )
+        server.start()
+        # Only the child writes to the pipe; closing our copy makes recv()
+        # raise EOFError instead of blocking if the server dies on startup
+        child_conn.close()
+        try:
+            try:
+                if not parent_conn.poll(STARTUP_TIMEOUT):
+                    print(f"Server did not start within {STARTUP_TIMEOUT:.0f} s", file=sys.stderr)
+                    sys.exit(2)
+                port, contact_ids = parent_conn.recv()
+            except EOFError:
+                server.join(5)
+                print(f"Server process exited during startup (exit code {server.exitcode})",
+                      file=sys.stderr)
+                sys.exit(2)
+
+            print(f"Serving {args.contacts} contacts on http://{HOST}:{port}, "
+                  f"{args.concurrency} connections for {args.duration:.0f} s\n")
+            load_test = LoadTest(port, contact_ids, args.mix)
+            elapsed = asyncio.run(load_test.run(args.concurrency, args.duration))
+            passed = load_test.report(elapsed, slos)
+        finally:
+            server.terminate()
+            server.join()
+
+    sys.exit(0 if passed else 1)
+
+if __name__ == "__main__":
+    main_cli()
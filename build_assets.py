@@ -0,0 +1,90 @@
+"""
+Build script for the web front-end assets.
+
+Minifies the sources in static/src and writes them to static/dist with
+content-hashed filenames, plus a manifest mapping logical names to the
+hashed files. Run it after editing any file in static/src:
+
+    python build_assets.py
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+
+from config import STATIC_DIR, ASSET_SOURCE_DIR, ASSET_DIST_DIR, ASSET_MANIFEST
+
+logger = logging.getLogger(__name__)
+
+def minify_css(source: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.S)
+    source = re.sub(r"\s+", " ", source)
+    source = re.sub(r"\s*([{}:;,>+])\s*", r"\1", source)
+    return source.replace(";}", "}").strip()
+
+def minify_js(source: str) -> str:
+    """Strip indentation, blank lines and full-line comments from a script."""
+    lines = []
+    for line in source.splitlines():
+        line = line.strip()
+        if line and not line.startswith("//"):
+            lines.append(line)
+    return "\n".join(lines)
+
+MINIFIERS = {
+    ".css": minify_css,
+    ".js": minify_js,
+}
+
+def build_assets() -> dict:
+    """
+    Minify and fingerprint every asset in the source directory.
+
+    Returns:
+        dict: Manifest mapping source filenames to hashed dist filenames
+    """
+    source_dir = Path(STATIC_DIR) / ASSET_SOURCE_DIR
+    dist_dir = Path(STATIC_DIR) / ASSET_DIST_DIR
+    dist_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest_path = dist_dir / ASSET_MANIFEST
+    try:
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        previous = {}
+
+    manifest = {}
+    for source_file in sorted(source_dir.iterdir()):
+        minify = MINIFIERS.get(source_file.suffix)
+        if minify is None:
+            continue
+
+        content = minify(source_file.read_text(encoding="utf-8")).encode("utf-8")
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        hashed_name = f"{source_file.stem}.{digest}{source_file.suffix}"
+        (dist_dir / hashed_name).write_bytes(content)
+        manifest[source_file.name] = hashed_name
+        logger.info(f"Built {source_file.name} -> {hashed_name} ({len(content)} bytes)")
+
+    # Replace the manifest atomically so a running server never reads half of it
+    tmp_manifest = manifest_path.with_name(f"{ASSET_MANIFEST}.tmp")
+    with open(tmp_manifest, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_manifest, manifest_path)
+
+    # Keep the previous build so pages rendered before the rebuild still load,
+    # and remove anything older
+    keep = set(manifest.values()) | set(previous.values()) | {ASSET_MANIFEST}
+    for old_file in dist_dir.iterdir():
+        if old_file.name not in keep:
+            old_file.unlink()
+            logger.info(f"Removed stale asset {old_file.name}")
+
+    return manifest
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    build_assets()
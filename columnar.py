@@ -0,0 +1,188 @@
+"""
+Module providing a NumPy-backed columnar view of a ContactBook for batch operations.
+"""
+import logging
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from contacts import Contact, ContactBook
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("name", "phone", "email", "address")
+
+class ContactColumns:
+    """Fixed-width string columns over a snapshot of a ContactBook."""
+
+    def __init__(self, contact_book: ContactBook):
+        """
+        Build the columnar view from the contacts currently in the book.
+
+        Args:
+            contact_book (ContactBook): ContactBook instance to view and write back to
+        """
+        self.contact_book = contact_book
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Rebuild the columns from the book, discarding uncommitted changes."""
+        self._contacts: List[Contact] = self.contact_book.get_all_contacts()
+        self.ids = np.array([c.contact_id for c in self._contacts], dtype=str)
+        self.columns: Dict[str, np.ndarray] = {
+            field: np.array([getattr(c, field) for c in self._contacts], dtype=str)
+            for field in FIELDS
+        }
+        self._original: Dict[str, np.ndarray] = {}
+        self.conflicts: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._contacts)
+
+    def _column(self, field: str) -> np.ndarray:
+        """Return the column for a field, rejecting unknown field names."""
+        if field not in self.columns:
+            raise ValueError(f"Unknown contact field: {field}")
+        return self.columns[field]
+
+    def equals(self, field: str, value: str, case_sensitive: bool = False) -> np.ndarray:
+        """
+        Build a boolean mask of rows whose field equals the value.
+
+        Args:
+            field (str): Contact field to compare
+            value (str): Value to match
+            case_sensitive (bool): Whether the comparison respects case
+
+        Returns:
+            np.ndarray: Boolean mask with one entry per contact
+        """
+        column = self._column(field)
+        value = value.strip()
+        if not case_sensitive:
+            column = np.char.lower(column)
+            value = value.lower()
+        return column == value
+
+    def contains(self, field: str, query: str, case_sensitive: bool = False) -> np.ndarray:
+        """
+        Build a boolean mask of rows whose field contains the query string.
+
+        Args:
+            field (str): Contact field to search
+            query (str): Substring to look for
+            case_sensitive (bool): Whether the search respects case
+
+        Returns:
+            np.ndarray: Boolean mask with one entry per contact
+        """
+        column = self._column(field)
+        if not case_sensitive:
+            column = np.char.lower(column)
+            query = query.lower()
+        return np.char.find(column, query) >= 0
+
+    def select(self, mask: np.ndarray) -> List[Contact]:
+        """
+        Get the contacts selected by a boolean mask.
+
+        Args:
+            mask (np.ndarray): Boolean mask with one entry per contact
+
+        Returns:
+            List[Contact]: Contacts for which the mask is True
+        """
+        return [self._contacts[i] for i in np.flatnonzero(mask)]
+
+    def transform(
+        self,
+        field: str,
+        func: Callable[[np.ndarray], np.ndarray],
+        mask: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Apply a vectorized function to a column, optionally only on masked rows.
+
+        Args:
+            field (str): Contact field to transform
+            func (Callable): Function taking and returning a string array, e.g. np.char.lower
+            mask (Optional[np.ndarray]): Rows to transform, or None for all rows
+        """
+        column = self._column(field)
+        result = np.asarray(func(column), dtype=str)
+        if mask is not None:
+            result = np.where(mask, result, column)
+
+        self._original.setdefault(field, column)
+        self.columns[field] = result
+
+    def lower(self, field: str, mask: Optional[np.ndarray] = None) -> None:
+        """Lowercase a column, e.g. to normalize email addresses."""
+        self.transform(field, np.char.lower, mask)
+
+    def remove_chars(self, field: str, chars: str, mask: Optional[np.ndarray] = None) -> None:
+        """
+        Remove every occurrence of the given characters from a column.
+
+        Args:
+            field (str): Contact field to clean, e.g. "phone"
+            chars (str): Characters to remove, e.g. " -()/."
+            mask (Optional[np.ndarray]): Rows to clean, or None for all rows
+        """
+        def _strip(column: np.ndarray) -> np.ndarray:
+            for char in chars:
+                column = np.char.replace(column, char, "")
+            return column
+
+        self.transform(field, _strip, mask)
+
+    def changed_mask(self) -> np.ndarray:
+        """
+        Build a boolean mask of rows modified since the last refresh.
+
+        Returns:
+            np.ndarray: Boolean mask with one entry per contact
+        """
+        changed = np.zeros(len(self), dtype=bool)
+        for field, original in self._original.items():
+            changed |= self.columns[field] != original
+        return changed
+
+    def commit(self) -> int:
+        """
+        Write all modified rows back to the ContactBook in a single pass.
+
+        Rows whose transformed fields were changed in the book since the view
+        was built (or the contact was deleted) are skipped rather than
+        overwritten; their IDs are left in `conflicts`.
+
+        Returns:
+            int: Number of contacts that were updated
+        """
+        changed = np.flatnonzero(self.changed_mask())
+        if not len(changed):
+            self.conflicts = []
+            return 0
+
+        fields = list(self._original)
+        current = {c.contact_id: c for c in self.contact_book.contacts}
+        updates = {}
+        conflicts = []
+        for i in changed:
+            contact_id = str(self.ids[i])
+            contact = current.get(contact_id)
+            if contact is None or any(
+                getattr(contact, field) != str(self._original[field][i]) for field in fields
+            ):
+                conflicts.append(contact_id)
+                continue
+            updates[contact_id] = {field: str(self.columns[field][i]) for field in fields}
+
+        if conflicts:
+            logger.warning(f"Skipped {len(conflicts)} contacts changed in the book since the view was built")
+        updated = self.contact_book.bulk_update(updates) if updates else 0
+
+        # Re-sync so that further changes are diffed against the stored values
+        self.refresh()
+        self.conflicts = conflicts
+        return updated
@@ -6,6 +6,25 @@ import os
 
 # File paths
 CONTACTS_FILE = "contacts.json"
+SNAPSHOT_COUNT = 3  # Previous saves kept as contacts.json.1 ... .N for crash recovery
+
+# Storage format: compact JSON drops indentation to shrink the file and speed up saves
+COMPACT_STORAGE = False
+
+# API response settings
+FAST_JSON = True  # Serialize contacts directly instead of building intermediate dicts
+COMPRESSION_MIN_SIZE = 1024  # Responses smaller than this (bytes) are sent uncompressed
+COMPRESSION_LEVEL = 6
+SUGGEST_DEFAULT_K = 10  # Autocomplete suggestions returned when k is not given
+SUGGEST_MAX_K = 50
+COMPRESSIBLE_MIMETYPES = {"application/json", "text/html"}  # Static files are streamed and never compressed here
+
+# Static assets (see build_assets.py)
+STATIC_DIR = "static"
+ASSET_SOURCE_DIR = "src"
+ASSET_DIST_DIR = "dist"
+ASSET_MANIFEST = "manifest.json"
+STATIC_MAX_AGE = 31536000  # One year; dist filenames change whenever their content does
 
 # Logging configuration
 LOG_LEVEL = logging.INFO
@@ -0,0 +1,16 @@
+"""
+Shared pytest fixtures. Living at the repository root, this file also puts
+the application modules on sys.path for the tests in tests/.
+"""
+import pytest
+
+from contacts import Contact, ContactBook
+
+@pytest.fixture
+def contact_book():
+    """A small ContactBook with a few sample contacts."""
+    book = ContactBook()
+    book.add_contact(Contact("Jane Doe", "+49 (0) 151-123", "Jane.Doe@Example.com", "Main St 1, 10115 Berlin"))
+    book.add_contact(Contact("John Smith", "0151 456", "JOHN@example.com", "Side St 2, 80331 Munich"))
+    book.add_contact(Contact("Erika Mustermann", "(030) 789", "erika@example.de", "Hauptstr. 3, 10115 Berlin"))
+    return book
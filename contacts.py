@@ -5,6 +5,8 @@ import uuid
 import logging
 from typing import List, Optional, Dict
 
+from suggest import PrefixIndex
+
 logger = logging.getLogger(__name__)
 
 class Contact:
@@ -57,6 +59,7 @@ class ContactBook:
     def __init__(self):
         """Initialize an empty contact book."""
         self.contacts: List[Contact] = []
+        self.name_index = PrefixIndex()
 
     def add_contact(self, contact: Contact) -> bool:
         """
@@ -73,6 +76,7 @@ class ContactBook:
             return False
         
         self.contacts.append(contact)
+        self.name_index.add(contact.contact_id, contact.name, contact.email)
         logger.info(f"Added new contact: {contact.name}")
         return True
 
@@ -101,12 +105,51 @@ class ContactBook:
                     contact_id=contact_id
                 )
                 self.contacts[i] = updated_contact
+                if (updated_contact.name, updated_contact.email) != (contact.name, contact.email):
+                    self.name_index.add(contact_id, updated_contact.name, updated_contact.email)
                 logger.info(f"Updated contact: {updated_contact.name}")
                 return True
         
         logger.error(f"Contact not found with ID: {contact_id}")
         return False
 
+    def bulk_update(self, updates: Dict[str, Dict]) -> int:
+        """
+        Update many contacts in a single pass over the book.
+
+        Args:
+            updates (Dict[str, Dict]): Mapping of contact ID to the updated fields
+
+        Returns:
+            int: Number of contacts that were updated
+        """
+        updated = 0
+        reindex = []
+        for i, contact in enumerate(self.contacts):
+            updated_data = updates.get(contact.contact_id)
+            if updated_data is None:
+                continue
+            if not updated_data.get("name", contact.name).strip():
+                logger.error(f"Cannot update contact {contact.contact_id}: Name is required")
+                continue
+
+            updated_contact = Contact(
+                name=updated_data.get("name", contact.name),
+                phone=updated_data.get("phone", contact.phone),
+                email=updated_data.get("email", contact.email),
+                address=updated_data.get("address", contact.address),
+                contact_id=contact.contact_id
+            )
+            self.contacts[i] = updated_contact
+            if (updated_contact.name, updated_contact.email) != (contact.name, contact.email):
+                reindex.append((contact.contact_id, updated_contact.name, updated_contact.email))
+            updated += 1
+
+        if reindex:
+            self.name_index.add_many(reindex)
+        logger.info(f"Bulk updated {updated} contacts")
+        return updated
+
     def delete_contact(self, contact_id: str) -> bool:
         """
         Delete a contact from the book.
@@ -120,6 +163,7 @@ class ContactBook:
         for i, contact in enumerate(self.contacts):
             if contact.contact_id == contact_id:
                 del self.contacts[i]
+                self.name_index.remove(contact_id)
                 logger.info(f"Deleted contact: {contact.name}")
                 return True
         
@@ -150,6 +194,19 @@ class ContactBook:
         
         return results
 
+    def suggest(self, prefix: str, k: int = 10) -> List[Dict]:
+        """
+        Suggest contacts whose name or email local part starts with the prefix.
+        
+        Args:
+            prefix (str): Prefix typed by the user
+            k (int): Maximum number of suggestions
+            
+        Returns:
+            List[Dict]: Up to k suggestions, each with contact_id and name
+        """
+        return self.name_index.search(prefix, k)
+
     def get_all_contacts(self) -> List[Contact]:
         """
         Get all contacts in the book.
@@ -182,5 +239,13 @@ class ContactBook:
         contact_book = cls()
         for contact_data in data:
             contact = Contact.from_dict(contact_data)
-            contact_book.add_contact(contact)
+            if not contact.name:
+                logger.error("Cannot add contact: Name is required")
+                continue
+            contact_book.contacts.append(contact)
+
+        # Index in one sorted pass rather than one insert per contact
+        contact_book.name_index.add_many(
+            (c.contact_id, c.name, c.email) for c in contact_book.contacts
+        )
         return contact_book
\ No newline at end of file
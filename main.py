@@ -1,14 +1,25 @@
 """
 Main entry point for the Contact Book application.
 """
+import gzip
+import hashlib
+import json
 import logging
 import sys
+import zlib
+from functools import lru_cache
 from pathlib import Path
 from flask import Flask, render_template, request, jsonify, redirect, url_for
 
-from config import LOG_LEVEL, LOG_FORMAT
+from config import (
+    LOG_LEVEL, LOG_FORMAT,
+    FAST_JSON, SUGGEST_DEFAULT_K, SUGGEST_MAX_K,
+    COMPRESSION_MIN_SIZE, COMPRESSION_LEVEL, COMPRESSIBLE_MIMETYPES,
+    STATIC_DIR, ASSET_SOURCE_DIR, ASSET_DIST_DIR, ASSET_MANIFEST, STATIC_MAX_AGE
+)
 from storage import load_contacts, save_contacts
 from contacts import Contact
+from serialization import contacts_to_json
 
 def setup_logging():
     """Configure logging for the application."""
@@ -27,22 +38,118 @@ def setup_logging():
     )
 
 # Initialize Flask app
-app = Flask(__name__)
+app = Flask(__name__, static_folder=STATIC_DIR)
 contact_book = None
 
+def _asset_manifest_path() -> Path:
+    """Return the path of the manifest written by build_assets.py."""
+    return Path(app.static_folder) / ASSET_DIST_DIR / ASSET_MANIFEST
+
+def _asset_manifest_version():
+    """Return the manifest's modification time, or None if it does not exist."""
+    try:
+        return _asset_manifest_path().stat().st_mtime_ns
+    except OSError:
+        return None
+
+@lru_cache(maxsize=1)
+def _read_asset_manifest(version) -> dict:
+    """Read the manifest; cached per version so a rebuild is picked up."""
+    try:
+        with open(_asset_manifest_path(), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logging.getLogger(__name__).warning(f"Asset manifest unavailable, serving unbuilt assets: {e}")
+        return {}
+
+def load_asset_manifest() -> dict:
+    """Load the mapping of asset names to content-hashed files written by build_assets.py."""
+    return _read_asset_manifest(_asset_manifest_version())
+
+@app.template_global()
+def asset_url(name: str) -> str:
+    """Return the URL of a built asset, falling back to its unminified source."""
+    hashed_name = load_asset_manifest().get(name)
+    if hashed_name:
+        return url_for('static', filename=f"{ASSET_DIST_DIR}/{hashed_name}")
+    return url_for('static', filename=f"{ASSET_SOURCE_DIR}/{name}")
+
+@app.after_request
+def cache_static_assets(response):
+    """Let clients cache content-hashed assets indefinitely."""
+    if (request.endpoint == 'static'
+            and request.view_args.get('filename', '').startswith(f"{ASSET_DIST_DIR}/")
+            and response.status_code == 200):
+        response.headers["Cache-Control"] = f"public, max-age={STATIC_MAX_AGE}, immutable"
+    return response
+
+@app.after_request
+def compress_response(response):
+    """Compress large responses when the client accepts gzip or deflate."""
+    if (response.direct_passthrough
+            or response.status_code != 200
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    data = response.get_data()
+    if len(data) < COMPRESSION_MIN_SIZE:
+        return response
+
+    encoding = request.accept_encodings.best_match(["gzip", "deflate"])
+    if encoding == "gzip":
+        response.set_data(gzip.compress(data, compresslevel=COMPRESSION_LEVEL))
+    elif encoding == "deflate":
+        response.set_data(zlib.compress(data, COMPRESSION_LEVEL))
+    else:
+        return response
+
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+def _render_index_uncached():
+    """Render the main page and its ETag."""
+    html = render_template('index.html')
+    return html, hashlib.sha256(html.encode('utf-8')).hexdigest()
+
+@lru_cache(maxsize=1)
+def _render_index_cached(manifest_version):
+    """Render the main page once per asset build; contacts are fetched client-side."""
+    return _render_index_uncached()
+
+def render_index():
+    """Return the pre-rendered main page, re-rendering after an asset rebuild or in debug mode."""
+    if app.debug:
+        return _render_index_uncached()
+    return _render_index_cached(_asset_manifest_version())
+
 @app.route('/')
 def index():
     """Render the main page."""
-    contacts = contact_book.get_all_contacts()
-    return render_template('index.html', contacts=contacts)
+    html, etag = render_index()
+    response = app.response_class(html, mimetype='text/html')
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
 
 @app.route('/api/contacts', methods=['GET'])
 def get_contacts():
     """API endpoint to get contacts."""
     query = request.args.get('q', '').lower()
     contacts = contact_book.search_contacts(query)
+    if FAST_JSON:
+        return app.response_class(contacts_to_json(contacts), mimetype='application/json')
     return jsonify([contact.to_dict() for contact in contacts])
 
+@app.route('/api/contacts/suggest', methods=['GET'])
+def suggest_contacts():
+    """API endpoint for name autocomplete."""
+    prefix = request.args.get('prefix', '')
+    k = request.args.get('k', SUGGEST_DEFAULT_K, type=int)
+    k = max(1, min(k, SUGGEST_MAX_K))
+    return jsonify(contact_book.suggest(prefix, k))
+
 @app.route('/api/contacts', methods=['POST'])
 def add_contact():
     """API endpoint to add a new contact."""
@@ -55,7 +162,8 @@ def add_contact():
     )
     
     if contact_book.add_contact(contact):
-        save_contacts(contact_book)
+        if not save_contacts(contact_book):
+            return jsonify({"success": False, "error": "Failed to save contacts"}), 500
         return jsonify({"success": True, "contact": contact.to_dict()})
     return jsonify({"success": False, "error": "Failed to add contact"}), 400
 
@@ -64,7 +172,8 @@ def update_contact(contact_id):
     """API endpoint to update a contact."""
     data = request.json
     if contact_book.update_contact(contact_id, data):
-        save_contacts(contact_book)
+        if not save_contacts(contact_book):
+            return jsonify({"success": False, "error": "Failed to save contacts"}), 500
         return jsonify({"success": True})
     return jsonify({"success": False, "error": "Contact not found"}), 404
 
@@ -72,7 +181,8 @@ def update_contact(contact_id):
 def delete_contact(contact_id):
     """API endpoint to delete a contact."""
     if contact_book.delete_contact(contact_id):
-        save_contacts(contact_book)
+        if not save_contacts(contact_book):
+            return jsonify({"success": False, "error": "Failed to save contacts"}), 500
         return jsonify({"success": True})
     return jsonify({"success": False, "error": "Contact not found"}), 404
 
@@ -0,0 +1,40 @@
+"""
+Module for fast JSON serialization of contacts without intermediate dictionaries.
+"""
+from json.encoder import encode_basestring, encode_basestring_ascii
+from typing import Iterable
+
+from contacts import Contact
+
+def contact_to_json(contact: Contact, ensure_ascii: bool = True) -> str:
+    """
+    Serialize a single contact to a compact JSON object.
+
+    Args:
+        contact (Contact): Contact to serialize
+        ensure_ascii (bool): Whether to escape non-ASCII characters
+
+    Returns:
+        str: JSON object with the same keys as Contact.to_dict()
+    """
+    encode = encode_basestring_ascii if ensure_ascii else encode_basestring
+    return (
+        f'{{"contact_id":{encode(contact.contact_id)},'
+        f'"name":{encode(contact.name)},'
+        f'"phone":{encode(contact.phone)},'
+        f'"email":{encode(contact.email)},'
+        f'"address":{encode(contact.address)}}}'
+    )
+
+def contacts_to_json(contacts: Iterable[Contact], ensure_ascii: bool = True) -> str:
+    """
+    Serialize contacts to a compact JSON array.
+
+    Args:
+        contacts (Iterable[Contact]): Contacts to serialize
+        ensure_ascii (bool): Whether to escape non-ASCII characters
+
+    Returns:
+        str: JSON array equivalent to json.dumps of the contacts' dictionaries
+    """
+    return "[" + ",".join(contact_to_json(c, ensure_ascii) for c in contacts) + "]"
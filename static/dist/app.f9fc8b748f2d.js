@@ -0,0 +1,145 @@
+const EDIT_ICON = '<svg class="icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" aria-hidden="true"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M15.232 5.232l3.536 3.536m-2.036-5.036a2.5 2.5 0 113.536 3.536L6.5 21.036H3v-3.572L16.732 3.732z"/></svg>';
+const DELETE_ICON = '<svg class="icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" aria-hidden="true"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 7l-.867 12.142A2 2 0 0116.138 21H7.862a2 2 0 01-1.995-1.858L5 7m5 4v6m4-6v6m1-10V4a1 1 0 00-1-1h-4a1 1 0 00-1 1v3M4 7h16"/></svg>';
+const SUGGEST_LIMIT = 10;
+const SEARCH_DEBOUNCE_MS = 300;
+let searchTimer = null;
+document.addEventListener('DOMContentLoaded', () => loadContacts());
+document.getElementById('search').addEventListener('input', (e) => {
+const query = e.target.value;
+loadSuggestions(query);
+clearTimeout(searchTimer);
+searchTimer = setTimeout(() => loadContacts(query), SEARCH_DEBOUNCE_MS);
+});
+async function loadSuggestions(prefix) {
+const datalist = document.getElementById('search-suggestions');
+if (!prefix.trim()) {
+datalist.innerHTML = '';
+return;
+}
+try {
+const response = await fetch(`/api/contacts/suggest?prefix=${encodeURIComponent(prefix)}&k=${SUGGEST_LIMIT}`);
+const suggestions = await response.json();
+datalist.innerHTML = '';
+suggestions.forEach(suggestion => {
+const option = document.createElement('option');
+option.value = suggestion.name;
+datalist.appendChild(option);
+});
+} catch (error) {
+console.error('Error loading suggestions:', error);
+}
+}
+async function loadContacts(query = '') {
+try {
+const response = await fetch(`/api/contacts?q=${encodeURIComponent(query)}`);
+const contacts = await response.json();
+displayContacts(contacts);
+} catch (error) {
+console.error('Error loading contacts:', error);
+alert('Failed to load contacts');
+}
+}
+function displayContacts(contacts) {
+const tbody = document.getElementById('contacts-table-body');
+tbody.innerHTML = '';
+contacts.forEach(contact => {
+const tr = document.createElement('tr');
+tr.innerHTML = `
+<td class="px-6 py-4 whitespace-nowrap">
+<div class="text-sm font-medium text-gray-900">${contact.name}</div>
+</td>
+<td class="px-6 py-4 whitespace-nowrap">
+<div class="text-sm text-gray-900">${contact.phone}</div>
+</td>
+<td class="px-6 py-4 whitespace-nowrap">
+<div class="text-sm text-gray-900">${contact.email}</div>
+</td>
+<td class="px-6 py-4">
+<div class="text-sm text-gray-900">${contact.address}</div>
+</td>
+<td class="px-6 py-4 whitespace-nowrap text-right text-sm font-medium">
+<button onclick="editContact('${contact.contact_id}')" class="text-blue-600 hover:text-blue-900 mr-3">
+${EDIT_ICON}
+</button>
+<button onclick="deleteContact('${contact.contact_id}')" class="text-red-600 hover:text-red-900">
+${DELETE_ICON}
+</button>
+</td>
+`;
+tbody.appendChild(tr);
+});
+}
+function openContactForm(contactId = null) {
+document.getElementById('contact-modal').classList.remove('hidden');
+document.getElementById('contact-form').reset();
+document.getElementById('contact-id').value = contactId || '';
+if (contactId) {
+fetch(`/api/contacts?q=${contactId}`)
+.then(response => response.json())
+.then(contacts => {
+const contact = contacts.find(c => c.contact_id === contactId);
+if (contact) {
+document.getElementById('name').value = contact.name;
+document.getElementById('phone').value = contact.phone;
+document.getElementById('email').value = contact.email;
+document.getElementById('address').value = contact.address;
+}
+})
+.catch(error => {
+console.error('Error loading contact:', error);
+alert('Failed to load contact details');
+});
+}
+}
+function closeContactForm() {
+document.getElementById('contact-modal').classList.add('hidden');
+}
+async function submitContactForm() {
+const form = document.getElementById('contact-form');
+const contactId = document.getElementById('contact-id').value;
+const data = {
+name: form.name.value,
+phone: form.phone.value,
+email: form.email.value,
+address: form.address.value
+};
+try {
+const url = contactId ? `/api/contacts/${contactId}` : '/api/contacts';
+const method = contactId ? 'PUT' : 'POST';
+const response = await fetch(url, {
+method: method,
+headers: {
+'Content-Type': 'application/json'
+},
+body: JSON.stringify(data)
+});
+if (!response.ok) {
+throw new Error('Failed to save contact');
+}
+closeContactForm();
+loadContacts();
+} catch (error) {
+console.error('Error saving contact:', error);
+alert('Failed to save contact');
+}
+}
+async function deleteContact(contactId) {
+if (!confirm('Are you sure you want to delete this contact?')) {
+return;
+}
+try {
+const response = await fetch(`/api/contacts/${contactId}`, {
+method: 'DELETE'
+});
+if (!response.ok) {
+throw new Error('Failed to delete contact');
+}
+loadContacts();
+} catch (error) {
+console.error('Error deleting contact:', error);
+alert('Failed to delete contact');
+}
+}
+async function editContact(contactId) {
+openContactForm(contactId);
+}
\ No newline at end of file
@@ -1,70 +1,201 @@
 """
 Module for handling data persistence of contacts using JSON storage.
+
+Saves are atomic: the data is written to a temporary file, flushed to disk
+and renamed over the contacts file, so a crash mid-write never leaves a
+truncated file behind. Each save starts with a checksum header and keeps
+the previous SNAPSHOT_COUNT versions as contacts.json.1, .2, and so on; the
+live file is hard-linked rather than moved into .1, so it never goes
+missing. On startup the newest snapshot whose checksum verifies is loaded.
+A live file that fails verification is renamed to contacts.json.corrupt
+instead of being rotated into the snapshots.
 """
+import hashlib
 import json
 import logging
-from typing import List, Dict
+import os
+import shutil
+import tempfile
+import threading
+from typing import List, Dict, Optional
 from pathlib import Path
 
-from config import CONTACTS_FILE
+from config import CONTACTS_FILE, COMPACT_STORAGE, SNAPSHOT_COUNT
 from contacts import Contact, ContactBook
+from serialization import contacts_to_json
 
 logger = logging.getLogger(__name__)
 
+HEADER_PREFIX = b"#contact-book v1 sha256="
+
+# Saves rotate and rename shared files, so concurrent saves must not interleave
+_save_lock = threading.Lock()
+
+def _snapshot_paths(file_path: Path) -> List[Path]:
+    """Return the contacts file followed by its snapshots, newest first."""
+    return [file_path] + [
+        file_path.with_name(f"{file_path.name}.{i}") for i in range(1, SNAPSHOT_COUNT + 1)
+    ]
+
+def _read_snapshot(file_path: Path) -> Optional[List[Dict]]:
+    """
+    Read and verify a single storage file.
+
+    Files without a checksum header (written before checksums were added)
+    are accepted if they parse as JSON.
+
+    Args:
+        file_path (Path): File to read
+
+    Returns:
+        Optional[List[Dict]]: The contact dictionaries, or None if the file is invalid
+    """
+    try:
+        data = file_path.read_bytes()
+    except OSError as e:
+        logger.error(f"Error reading {file_path}: {e}")
+        return None
+
+    if data.startswith(HEADER_PREFIX):
+        header, _, data = data.partition(b"\n")
+        expected = header[len(HEADER_PREFIX):].decode("ascii", errors="replace").strip()
+        if hashlib.sha256(data).hexdigest() != expected:
+            logger.error(f"Checksum mismatch in {file_path}")
+            return None
+
+    try:
+        contacts_data = json.loads(data.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        logger.error(f"Error decoding {file_path}: {e}")
+        return None
+
+    if not isinstance(contacts_data, list):
+        logger.error(f"Invalid contacts data format in {file_path}")
+        return None
+    return contacts_data
+
+def _set_aside(file_path: Path) -> None:
+    """Rename a damaged contacts file to .corrupt so it is kept out of the snapshots."""
+    try:
+        os.replace(file_path, file_path.with_name(f"{file_path.name}.corrupt"))
+    except OSError as e:
+        logger.error(f"Could not set aside damaged contacts file: {e}")
+
 def load_contacts() -> ContactBook:
     """
-    Load contacts from the JSON storage file.
-    
+    Load contacts from the newest valid storage file.
+
     Returns:
         ContactBook: A ContactBook instance containing the loaded contacts
     """
     try:
         file_path = Path(CONTACTS_FILE)
-        if not file_path.exists():
+        candidates = [path for path in _snapshot_paths(file_path) if path.exists()]
+        if not candidates:
             logger.info(f"Contacts file not found at {CONTACTS_FILE}. Starting with empty contact book.")
             return ContactBook()
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            contacts_data = json.load(f)
-            
-        if not isinstance(contacts_data, list):
-            logger.error("Invalid contacts data format. Starting with empty contact book.")
-            return ContactBook()
-            
-        contact_book = ContactBook.from_dict_list(contacts_data)
-        logger.info(f"Successfully loaded {len(contact_book.contacts)} contacts from storage")
-        return contact_book
+        for path in candidates:
+            contacts_data = _read_snapshot(path)
+            if contacts_data is None:
+                continue
+            try:
+                contact_book = ContactBook.from_dict_list(contacts_data)
+            except (KeyError, TypeError, AttributeError) as e:
+                logger.error(f"Invalid contact record in {path}: {e}")
+                continue
+
+            if path != file_path:
+                logger.warning(f"Recovered contacts from snapshot {path}")
+                if file_path.exists():
+                    _set_aside(file_path)
+            logger.info(f"Successfully loaded {len(contact_book.contacts)} contacts from storage")
+            return contact_book
 
-    except json.JSONDecodeError as e:
-        logger.error(f"Error decoding contacts file: {e}")
+        logger.error("No valid contacts file or snapshot found. Starting with empty contact book.")
+        if file_path.exists():
+            _set_aside(file_path)
         return ContactBook()
+
     except Exception as e:
         logger.error(f"Unexpected error loading contacts: {e}")
         return ContactBook()
 
+def _rotate_snapshots(file_path: Path) -> None:
+    """Shift .1 to .2 and so on, dropping the oldest, then link the live file as .1."""
+    paths = _snapshot_paths(file_path)
+    for older, newer in zip(reversed(paths[2:]), reversed(paths[1:-1])):
+        if newer.exists():
+            os.replace(newer, older)
+
+    if file_path.exists():
+        paths[1].unlink(missing_ok=True)
+        try:
+            os.link(file_path, paths[1])
+        except OSError:
+            shutil.copy2(file_path, paths[1])
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush directory entries so renames survive a power loss, where supported."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 def save_contacts(contact_book: ContactBook) -> bool:
     """
-    Save contacts to the JSON storage file.
-    
+    Atomically save contacts to the JSON storage file.
+
     Args:
         contact_book (ContactBook): The ContactBook instance to save
-        
+
     Returns:
         bool: True if contacts were saved successfully, False otherwise
     """
-    try:
-        contacts_data = contact_book.to_dict_list()
-        
-        # Create directory if it doesn't exist
-        file_path = Path(CONTACTS_FILE)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(contacts_data, f, indent=2, ensure_ascii=False)
-            
-        logger.info(f"Successfully saved {len(contacts_data)} contacts to storage")
-        return True
+    with _save_lock:
+        tmp_path = None
+        try:
+            # Create directory if it doesn't exist
+            file_path = Path(CONTACTS_FILE)
+            file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    except Exception as e:
-        logger.error(f"Error saving contacts: {e}")
-        return False
\ No newline at end of file
+            if COMPACT_STORAGE:
+                body = contacts_to_json(contact_book.contacts, ensure_ascii=False)
+            else:
+                body = json.dumps(contact_book.to_dict_list(), indent=2, ensure_ascii=False)
+            data = body.encode("utf-8")
+            header = HEADER_PREFIX + hashlib.sha256(data).hexdigest().encode("ascii") + b"\n"
+
+            fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header + data)
+                f.flush()
+                os.fsync(f.fileno())
+
+            if SNAPSHOT_COUNT > 0:
+                # Never rotate a damaged live file in; it would push out good snapshots
+                if file_path.exists() and _read_snapshot(file_path) is None:
+                    _set_aside(file_path)
+                else:
+                    _rotate_snapshots(file_path)
+            os.replace(tmp_path, file_path)
+            tmp_path = None
+            _fsync_directory(file_path.parent)
+
+            logger.info(f"Successfully saved {len(contact_book.contacts)} contacts to storage")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error saving contacts: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return False
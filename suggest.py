@@ -0,0 +1,141 @@
+"""
+Module containing the sorted prefix index used for contact name autocomplete.
+"""
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Tuple
+
+def normalize(text: str) -> str:
+    """Normalize text for prefix matching: case-folded with single spaces."""
+    return " ".join(text.casefold().split())
+
+class PrefixIndex:
+    """
+    Sorted array of normalized keys supporting prefix lookups with bisect.
+
+    The web API serves requests from several threads, so every method holds
+    the index lock; lookups would otherwise see the arrays half-updated.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._keys: List[Tuple[str, str]] = []
+        self._entries: Dict[str, Tuple[str, List[str]]] = {}
+        # Re-entrant because add and add_many remove existing entries first
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _keys_for(name: str, email: str) -> List[str]:
+        """
+        Build the index keys for a contact.
+
+        Every word of the name starts a key, so "Jane Doe" is found by both
+        "ja" and "do". The local part of the email address is indexed too.
+        """
+        words = normalize(name).split()
+        keys = [" ".join(words[i:]) for i in range(len(words))]
+        local_part = normalize(email).partition("@")[0]
+        if local_part and local_part not in keys:
+            keys.append(local_part)
+        return keys
+
+    def add(self, contact_id: str, name: str, email: str = "") -> None:
+        """
+        Add or replace the entry for a contact.
+
+        Args:
+            contact_id (str): ID of the contact
+            name (str): Contact's name, returned with suggestions
+            email (str): Contact's email address
+        """
+        keys = self._keys_for(name, email)
+        with self._lock:
+            if contact_id in self._entries:
+                self.remove(contact_id)
+            for key in keys:
+                insort(self._keys, (key, contact_id))
+            self._entries[contact_id] = (name, keys)
+
+    def add_many(self, entries: Iterable[Tuple[str, str, str]]) -> None:
+        """
+        Add or replace many entries, sorting the key array once.
+
+        Inserting one by one shifts the array on every insert, so bulk loads
+        and bulk updates should go through here.
+
+        Args:
+            entries (Iterable[Tuple[str, str, str]]): (contact_id, name, email) tuples
+        """
+        latest = {contact_id: (name, email) for contact_id, name, email in entries}
+        with self._lock:
+            self.remove_many(latest)
+            for contact_id, (name, email) in latest.items():
+                keys = self._keys_for(name, email)
+                self._keys.extend((key, contact_id) for key in keys)
+                self._entries[contact_id] = (name, keys)
+            self._keys.sort()
+
+    def remove_many(self, contact_ids: Iterable[str]) -> None:
+        """
+        Remove the entries for many contacts in a single pass.
+
+        Args:
+            contact_ids (Iterable[str]): IDs of the contacts to remove
+        """
+        with self._lock:
+            removed = {contact_id for contact_id in contact_ids if contact_id in self._entries}
+            if not removed:
+                return
+            for contact_id in removed:
+                del self._entries[contact_id]
+            self._keys = [pair for pair in self._keys if pair[1] not in removed]
+
+    def remove(self, contact_id: str) -> None:
+        """
+        Remove the entry for a contact, if present.
+
+        Args:
+            contact_id (str): ID of the contact
+        """
+        with self._lock:
+            entry = self._entries.pop(contact_id, None)
+            if entry is None:
+                return
+
+            for key in entry[1]:
+                i = bisect_left(self._keys, (key, contact_id))
+                if i < len(self._keys) and self._keys[i] == (key, contact_id):
+                    del self._keys[i]
+
+    def search(self, prefix: str, k: int = 10) -> List[Dict]:
+        """
+        Find up to k contacts with a key starting with the prefix.
+
+        Args:
+            prefix (str): Prefix typed by the user
+            k (int): Maximum number of suggestions
+
+        Returns:
+            List[Dict]: Suggestions in key order, each with contact_id and name
+        """
+        prefix = normalize(prefix)
+        if not prefix or k <= 0:
+            return []
+
+        results = []
+        seen = set()
+        with self._lock:
+            for i in range(bisect_left(self._keys, (prefix,)), len(self._keys)):
+                key, contact_id = self._keys[i]
+                if not key.startswith(prefix):
+                    break
+                if contact_id in seen:
+                    continue
+                seen.add(contact_id)
+                results.append({"contact_id": contact_id, "name": self._entries[contact_id][0]})
+                if len(results) >= k:
+                    break
+        return results
@@ -0,0 +1,21 @@
+import pytest
+
+import main
+
+@pytest.fixture
+def client(contact_book, monkeypatch):
+    monkeypatch.setattr(main, "contact_book", contact_book)
+    monkeypatch.setattr(main, "save_contacts", lambda book: False)
+    return main.app.test_client()
+
+def test_mutations_report_failed_saves(client, contact_book):
+    contact_id = contact_book.contacts[0].contact_id
+    fields = {"name": "New", "phone": "", "email": "", "address": ""}
+
+    for response in (
+        client.post("/api/contacts", json=fields),
+        client.put(f"/api/contacts/{contact_id}", json=fields),
+        client.delete(f"/api/contacts/{contact_id}"),
+    ):
+        assert response.status_code == 500
+        assert response.json == {"success": False, "error": "Failed to save contacts"}
@@ -0,0 +1,83 @@
+import json
+import os
+
+import pytest
+
+import main
+from config import ASSET_DIST_DIR, ASSET_MANIFEST, STATIC_MAX_AGE
+
+@pytest.fixture
+def static_dir(tmp_path, monkeypatch):
+    (tmp_path / ASSET_DIST_DIR).mkdir()
+    (tmp_path / "src").mkdir()
+    monkeypatch.setattr(main.app, "static_folder", str(tmp_path))
+    return tmp_path
+
+@pytest.fixture
+def client(static_dir):
+    return main.app.test_client()
+
+def write_manifest(static_dir, manifest, mtime_ns=None):
+    """Write a manifest and its hashed files, optionally forcing the mtime."""
+    dist_dir = static_dir / ASSET_DIST_DIR
+    for hashed_name in manifest.values():
+        (dist_dir / hashed_name).write_text("/* built */", encoding="utf-8")
+    path = dist_dir / ASSET_MANIFEST
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def asset_url(name):
+    with main.app.test_request_context():
+        return main.asset_url(name)
+
+def test_asset_url_uses_manifest(static_dir):
+    write_manifest(static_dir, {"app.css": "app.0123456789ab.css"})
+    assert asset_url("app.css") == "/static/dist/app.0123456789ab.css"
+
+def test_asset_url_falls_back_to_source(static_dir):
+    assert asset_url("app.css") == "/static/src/app.css"
+    write_manifest(static_dir, {"app.css": "app.0123456789ab.css"})
+    assert asset_url("app.js") == "/static/src/app.js"
+
+def test_asset_url_picks_up_rebuilt_manifest(static_dir):
+    write_manifest(static_dir, {"app.css": "app.aaaaaaaaaaaa.css"}, mtime_ns=1_000_000_000)
+    assert asset_url("app.css") == "/static/dist/app.aaaaaaaaaaaa.css"
+    write_manifest(static_dir, {"app.css": "app.bbbbbbbbbbbb.css"}, mtime_ns=2_000_000_000)
+    assert asset_url("app.css") == "/static/dist/app.bbbbbbbbbbbb.css"
+
+def test_dist_assets_are_cached_for_a_year(client, static_dir):
+    write_manifest(static_dir, {"app.css": "app.0123456789ab.css"})
+    response = client.get("/static/dist/app.0123456789ab.css")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == f"public, max-age={STATIC_MAX_AGE}, immutable"
+    response.close()
+
+def test_source_assets_are_not_marked_immutable(client, static_dir):
+    (static_dir / "src" / "app.css").write_text("body {}", encoding="utf-8")
+    response = client.get("/static/src/app.css")
+    assert response.status_code == 200
+    assert "immutable" not in response.headers.get("Cache-Control", "")
+    response.close()
+
+def test_index_has_weak_etag_and_answers_304(client, static_dir):
+    write_manifest(static_dir, {"app.css": "app.0123456789ab.css", "app.js": "app.0123456789ab.js"})
+    response = client.get("/")
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert response.headers["ETag"].startswith('W/"')
+    assert "/static/dist/app.0123456789ab.css" in response.get_data(as_text=True)
+
+    cached = client.get("/", headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+def test_index_is_rerendered_after_rebuild(client, static_dir):
+    write_manifest(static_dir, {"app.css": "app.aaaaaaaaaaaa.css"}, mtime_ns=1_000_000_000)
+    first = client.get("/")
+    write_manifest(static_dir, {"app.css": "app.bbbbbbbbbbbb.css"}, mtime_ns=2_000_000_000)
+    second = client.get("/")
+
+    assert "app.bbbbbbbbbbbb.css" in second.get_data(as_text=True)
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert client.get("/", headers={"If-None-Match": first.headers["ETag"]}).status_code == 200
@@ -0,0 +1,54 @@
+import numpy as np
+
+from columnar import ContactColumns
+
+def test_equals_is_case_insensitive_by_default(contact_book):
+    columns = ContactColumns(contact_book)
+    mask = columns.equals("email", "jane.doe@example.com")
+    assert [c.name for c in columns.select(mask)] == ["Jane Doe"]
+    assert not columns.equals("email", "jane.doe@example.com", case_sensitive=True).any()
+
+def test_contains_builds_mask(contact_book):
+    columns = ContactColumns(contact_book)
+    mask = columns.contains("address", "10115")
+    assert mask.tolist() == [True, False, True]
+
+def test_transform_with_mask_only_touches_masked_rows(contact_book):
+    columns = ContactColumns(contact_book)
+    columns.transform("name", np.char.upper, mask=columns.contains("address", "berlin"))
+    assert columns.columns["name"].tolist() == ["JANE DOE", "John Smith", "ERIKA MUSTERMANN"]
+    assert columns.changed_mask().tolist() == [True, False, True]
+
+def test_commit_writes_changed_rows_back(contact_book):
+    columns = ContactColumns(contact_book)
+    columns.lower("email")
+    columns.remove_chars("phone", " ()-")
+
+    assert columns.commit() == 3
+    assert [c.email for c in contact_book.contacts] == [
+        "jane.doe@example.com", "john@example.com", "erika@example.de"
+    ]
+    assert [c.phone for c in contact_book.contacts] == ["+490151123", "0151456", "030789"]
+    assert not columns.changed_mask().any()
+    assert columns.commit() == 0
+
+def test_commit_skips_rows_changed_in_book_since_refresh(contact_book):
+    columns = ContactColumns(contact_book)
+    columns.remove_chars("phone", " ()-")
+    jane, john, erika = contact_book.contacts
+    contact_book.update_contact(john.contact_id, {"phone": "0151 999"})
+    contact_book.delete_contact(jane.contact_id)
+
+    assert columns.commit() == 1
+    assert sorted(columns.conflicts) == sorted([jane.contact_id, john.contact_id])
+    assert [c.phone for c in contact_book.contacts] == ["0151 999", "030789"]
+
+def test_commit_keeps_untransformed_fields_changed_in_book(contact_book):
+    columns = ContactColumns(contact_book)
+    columns.lower("email")
+    jane = contact_book.contacts[0]
+    contact_book.update_contact(jane.contact_id, {"phone": "999"})
+
+    columns.commit()
+    assert contact_book.contacts[0].phone == "999"
+    assert contact_book.contacts[0].email == "jane.doe@example.com"
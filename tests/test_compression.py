@@ -0,0 +1,62 @@
+import gzip
+import json
+import zlib
+
+import pytest
+
+import main
+import storage
+from config import COMPRESSION_MIN_SIZE
+from contacts import Contact, ContactBook
+from serialization import contact_to_json, contacts_to_json
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "CONTACTS_FILE", str(tmp_path / "contacts.json"))
+    return main.app.test_client()
+
+@pytest.fixture
+def large_book(monkeypatch):
+    book = ContactBook()
+    for i in range(200):
+        book.add_contact(Contact(f"Person {i}", f"0151 {i}", f"person{i}@example.com", "Main St"))
+    monkeypatch.setattr(main, "contact_book", book)
+    return book
+
+def test_contacts_to_json_matches_json_dumps():
+    contacts = [
+        Contact('Jürgen "JJ" Müller', "+49\t1", "j@example.com", "Line 1\nLine 2 \\ €"),
+        Contact("Plain", "", "", "", contact_id="fixed-id"),
+    ]
+    expected = [c.to_dict() for c in contacts]
+    assert contacts_to_json(contacts) == json.dumps(expected, separators=(",", ":"))
+    assert contacts_to_json(contacts, ensure_ascii=False) == json.dumps(
+        expected, separators=(",", ":"), ensure_ascii=False
+    )
+    assert json.loads(contact_to_json(contacts[0])) == expected[0]
+    assert contacts_to_json([]) == "[]"
+
+def test_small_responses_are_not_compressed(client, contact_book, monkeypatch):
+    monkeypatch.setattr(main, "contact_book", contact_book)
+    response = client.get("/api/contacts", headers={"Accept-Encoding": "gzip"})
+    assert len(response.data) < COMPRESSION_MIN_SIZE
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+def test_large_responses_are_gzipped(client, large_book):
+    response = client.get("/api/contacts", headers={"Accept-Encoding": "gzip, deflate"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert int(response.headers["Content-Length"]) == len(response.data)
+    assert json.loads(gzip.decompress(response.data)) == large_book.to_dict_list()
+
+def test_deflate_is_used_when_gzip_is_not_accepted(client, large_book):
+    response = client.get("/api/contacts", headers={"Accept-Encoding": "gzip;q=0, deflate"})
+    assert response.headers["Content-Encoding"] == "deflate"
+    assert json.loads(zlib.decompress(response.data)) == large_book.to_dict_list()
+
+@pytest.mark.parametrize("accept_encoding", [None, "identity", "br"])
+def test_unsupported_encodings_get_identity(client, large_book, accept_encoding):
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+    response = client.get("/api/contacts", headers=headers)
+    assert "Content-Encoding" not in response.headers
+    assert response.json == large_book.to_dict_list()
@@ -0,0 +1,145 @@
+import json
+import os
+import threading
+
+import pytest
+
+import storage
+from config import SNAPSHOT_COUNT
+from contacts import Contact, ContactBook
+
+@pytest.fixture
+def contacts_file(tmp_path, monkeypatch):
+    path = tmp_path / "contacts.json"
+    monkeypatch.setattr(storage, "CONTACTS_FILE", str(path))
+    return path
+
+def snapshot(path, i):
+    return path.with_name(f"{path.name}.{i}")
+
+def save_versions(contact_book, count):
+    """Save the book `count` times, adding one contact before each save."""
+    for i in range(count):
+        contact_book.add_contact(Contact(f"Version {i}", "", "", ""))
+        assert storage.save_contacts(contact_book)
+
+def loaded_names(contact_book):
+    return [c.name for c in contact_book.contacts]
+
+def test_save_writes_checksum_header_and_round_trips(contacts_file, contact_book):
+    assert storage.save_contacts(contact_book)
+    assert contacts_file.read_bytes().startswith(storage.HEADER_PREFIX)
+    assert storage.load_contacts().to_dict_list() == contact_book.to_dict_list()
+
+def test_file_without_header_still_loads(contacts_file, contact_book):
+    contacts_file.write_text(json.dumps(contact_book.to_dict_list(), indent=2), encoding="utf-8")
+    assert storage.load_contacts().to_dict_list() == contact_book.to_dict_list()
+
+def test_missing_file_gives_empty_book(contacts_file):
+    assert storage.load_contacts().contacts == []
+
+def test_rotation_keeps_previous_versions_newest_first(contacts_file):
+    book = ContactBook()
+    save_versions(book, SNAPSHOT_COUNT + 2)
+
+    assert not snapshot(contacts_file, SNAPSHOT_COUNT + 1).exists()
+    total = SNAPSHOT_COUNT + 2
+    for i in range(1, SNAPSHOT_COUNT + 1):
+        assert len(storage._read_snapshot(snapshot(contacts_file, i))) == total - i
+    assert len(storage._read_snapshot(contacts_file)) == total
+
+def test_truncated_primary_falls_back_to_newest_snapshot(contacts_file):
+    book = ContactBook()
+    save_versions(book, 3)
+    data = contacts_file.read_bytes()
+    contacts_file.write_bytes(data[:len(data) // 2])
+
+    recovered = storage.load_contacts()
+    assert loaded_names(recovered) == ["Version 0", "Version 1"]
+    assert not contacts_file.exists()
+    assert contacts_file.with_name("contacts.json.corrupt").read_bytes() == data[:len(data) // 2]
+
+def test_checksum_mismatch_with_valid_json_falls_back(contacts_file):
+    book = ContactBook()
+    save_versions(book, 2)
+    contacts_file.write_bytes(contacts_file.read_bytes().replace(b"Version 1", b"Version X"))
+
+    assert loaded_names(storage.load_contacts()) == ["Version 0"]
+
+def test_fallback_skips_every_invalid_snapshot_in_order(contacts_file):
+    book = ContactBook()
+    save_versions(book, 3)
+    contacts_file.write_bytes(b"")
+    snapshot(contacts_file, 1).write_bytes(b"{not json")
+
+    assert loaded_names(storage.load_contacts()) == ["Version 0"]
+
+def test_all_invalid_gives_empty_book(contacts_file):
+    book = ContactBook()
+    save_versions(book, 2)
+    for path in (contacts_file, snapshot(contacts_file, 1)):
+        path.write_bytes(b"garbage")
+
+    assert storage.load_contacts().contacts == []
+    assert not contacts_file.exists()
+    assert contacts_file.with_name("contacts.json.corrupt").read_bytes() == b"garbage"
+
+    save_versions(ContactBook(), SNAPSHOT_COUNT + 1)
+    assert contacts_file.with_name("contacts.json.corrupt").read_bytes() == b"garbage"
+
+def test_save_does_not_rotate_damaged_live_file(contacts_file):
+    book = ContactBook()
+    save_versions(book, 2)
+    previous = snapshot(contacts_file, 1).read_bytes()
+    contacts_file.write_bytes(b"garbage")
+
+    save_versions(book, 1)
+    assert snapshot(contacts_file, 1).read_bytes() == previous
+    assert not snapshot(contacts_file, 2).exists()
+    assert contacts_file.with_name("contacts.json.corrupt").read_bytes() == b"garbage"
+    assert loaded_names(storage.load_contacts()) == ["Version 0", "Version 1", "Version 0"]
+
+def test_recovery_survives_failure_to_set_aside_damaged_file(contacts_file, monkeypatch):
+    book = ContactBook()
+    save_versions(book, 2)
+    contacts_file.write_bytes(b"garbage")
+
+    def fail_replace(src, dst):
+        raise PermissionError("read-only directory")
+    monkeypatch.setattr(storage.os, "replace", fail_replace)
+
+    assert loaded_names(storage.load_contacts()) == ["Version 0"]
+
+def test_previous_version_is_linked_not_moved(contacts_file, monkeypatch):
+    book = ContactBook()
+    save_versions(book, 1)
+    seen = []
+    real_replace = os.replace
+
+    def checking_replace(src, dst):
+        if str(dst) == str(contacts_file):
+            seen.append(contacts_file.exists())
+        real_replace(src, dst)
+    monkeypatch.setattr(storage.os, "replace", checking_replace)
+
+    save_versions(book, 1)
+    assert seen == [True]
+
+def test_concurrent_saves_all_succeed(contacts_file):
+    book = ContactBook()
+    save_versions(book, 1)
+    results = []
+
+    def worker():
+        for _ in range(20):
+            results.append(storage.save_contacts(book))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [True] * 160
+    assert loaded_names(storage.load_contacts()) == ["Version 0"]
+    assert not list(contacts_file.parent.glob("*.tmp"))
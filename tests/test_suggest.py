@@ -0,0 +1,79 @@
+import sys
+import threading
+
+from contacts import Contact, ContactBook
+from suggest import PrefixIndex
+
+def names(suggestions):
+    return [s["name"] for s in suggestions]
+
+def test_suggest_matches_name_words_and_email_local_part(contact_book):
+    assert names(contact_book.suggest("ja")) == ["Jane Doe"]
+    assert names(contact_book.suggest("MUSTER")) == ["Erika Mustermann"]
+    assert names(contact_book.suggest("john")) == ["John Smith"]
+    assert contact_book.suggest("example") == []
+    assert contact_book.suggest("  ") == []
+
+def test_suggest_returns_each_contact_once_and_respects_k(contact_book):
+    contact_book.add_contact(Contact("Jan Jansen", "", "jan@example.com", ""))
+    assert names(contact_book.suggest("jan")) == ["Jan Jansen", "Jane Doe"]
+    assert len(contact_book.suggest("j", k=1)) == 1
+
+def test_mutations_keep_index_in_sync(contact_book):
+    jane, john, _ = contact_book.contacts
+    contact_book.update_contact(jane.contact_id, {"name": "Janet Roe"})
+    contact_book.delete_contact(john.contact_id)
+    contact_book.bulk_update({jane.contact_id: {"email": "jroe@example.com"}})
+
+    assert names(contact_book.suggest("janet")) == ["Janet Roe"]
+    assert names(contact_book.suggest("jroe")) == ["Janet Roe"]
+    assert contact_book.suggest("doe") == []
+    assert contact_book.suggest("john") == []
+
+def test_from_dict_list_builds_same_index_as_incremental_adds(contact_book):
+    loaded = ContactBook.from_dict_list(contact_book.to_dict_list())
+    assert loaded.name_index._keys == contact_book.name_index._keys
+    assert len(loaded.name_index) == 3
+
+def test_add_many_replaces_existing_entries():
+    index = PrefixIndex()
+    index.add("1", "Old Name", "")
+    index.add_many([("1", "New Name", ""), ("2", "Other", ""), ("2", "Latest", "")])
+
+    assert names(index.search("old")) == []
+    assert names(index.search("new")) == ["New Name"]
+    assert names(index.search("other")) == []
+    assert names(index.search("latest")) == ["Latest"]
+    assert index._keys == sorted(index._keys)
+
+def test_search_is_safe_during_concurrent_updates():
+    index = PrefixIndex()
+    index.add_many((str(i), f"Contact {i}", "") for i in range(200))
+    done = threading.Event()
+    errors = []
+
+    def reader():
+        try:
+            while not done.is_set():
+                index.search("contact", k=500)
+        except Exception as e:
+            errors.append(e)
+
+    # Switch threads as often as possible so unguarded reads would interleave
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in readers:
+            thread.start()
+        for i in range(2000):
+            index.remove(str(i % 200))
+            index.add(str(i % 200), f"Contact {i}", "")
+        done.set()
+        for thread in readers:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert errors == []
+    assert len(index.search("contact", k=500)) == 200
@@ -9,7 +9,7 @@ from typing import Optional, Dict, Callable
 from contacts import Contact, ContactBook
 from storage import save_contacts
 from config import (
-    WINDOW_TITLE, WINDOW_SIZE, PADDING,
+    WINDOW_TITLE, WINDOW_SIZE, PADDING, SUGGEST_DEFAULT_K,
     PRIMARY_COLOR, SECONDARY_COLOR, BG_COLOR, TEXT_COLOR,
     COLUMNS
 )
@@ -228,11 +228,15 @@ class ContactBookUI:
         self.search_var.trace("w", lambda *args: self._on_search())
         
         ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=5)
-        ttk.Entry(
+        self.search_box = ttk.Combobox(
             search_frame,
             textvariable=self.search_var,
             width=40
-        ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        )
+        self.search_box.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.search_box.bind("<<ComboboxSelected>>", lambda e: self._on_suggestion_selected())
+        self._suggestions = []
+        self._picked_contact_id = None
 
         # Action buttons
         button_frame = ttk.Frame(header_frame)
@@ -325,8 +329,31 @@ class ContactBookUI:
     def _on_search(self):
         """Handle search input changes."""
         query = self.search_var.get()
+        # Picking a suggestion sets the text, which runs this handler before
+        # <<ComboboxSelected>>; remember which entry was picked while the
+        # combobox still holds the old list, since names need not be unique
+        index = self.search_box.current()
+        if 0 <= index < len(self._suggestions):
+            self._picked_contact_id = self._suggestions[index]["contact_id"]
+        else:
+            self._picked_contact_id = None
+
+        self._suggestions = self.contact_book.suggest(query, SUGGEST_DEFAULT_K)
+        self.search_box["values"] = [s["name"] for s in self._suggestions]
         self._refresh_contacts(query)
 
+    def _on_suggestion_selected(self):
+        """Select the contact picked from the type-ahead suggestions."""
+        contact_id = self._picked_contact_id
+        if contact_id is None:
+            return
+
+        for item in self.tree.get_children():
+            if self.tree.item(item, "tags")[0] == contact_id:
+                self.tree.selection_set(item)
+                self.tree.see(item)
+                break
+
     def _get_selected_contact(self) -> Optional[Contact]:
         """Get the currently selected contact."""
         selection = self.tree.selection()